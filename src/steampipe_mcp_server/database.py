@@ -1,29 +1,186 @@
 """Database service for PostgreSQL operations."""
 
-import json
-from typing import Any
-
+import asyncio
+import logging
+import math
+import re
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
+from typing import Any, TypeVar, cast
+
+import orjson
 import psycopg
 from mcp.server.fastmcp.utilities.logging import get_logger
+from psycopg import AsyncConnection
 from psycopg import sql as psycopg_sql
+from psycopg.conninfo import conninfo_to_dict
+from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Defaults for the settings exposed on the command line
+DEFAULT_POOL_MIN_SIZE = 2
+DEFAULT_POOL_MAX_SIZE = 10
+DEFAULT_PREPARE_STATEMENTS = True
+DEFAULT_MAX_QUERY_ROWS = 1000
+DEFAULT_MAX_QUERY_BYTES = 1024 * 1024
+DEFAULT_STATEMENT_TIMEOUT = 300.0
+DEFAULT_POOL_TIMEOUT = 10.0
+
+# Statements executed more than this many times on a connection are prepared
+# server-side, so later executions skip parsing and planning. 0 prepares every
+# statement on first use and None disables prepared statements entirely.
+PREPARE_THRESHOLD = 1
+# Table names in format schema.table, without further dots
+_TABLE_NAME_RE = re.compile(r"\A([^.]+)\.([^.]+)\Z")
+# Queries must start with a read-only command, after any whitespace, comments
+# and opening parentheses. Writes are still refused by the read-only session;
+# this only turns obvious ones away without a round trip.
+_READ_ONLY_PREFIX = re.compile(
+    r"\A(?:\s|--[^\n]*(?:\n|\Z)|/\*.*?\*/|\()*"
+    r"(?:select|with|explain|show|values|table)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# Rows fetched per network read when streaming. Chunked fetching needs
+# libpq 17; older versions fall back to fetching one row at a time.
+STREAM_BATCH_SIZE = 1000
+# Transactions left idle, e.g. by a client stalled in the middle of a stream,
+# are ended by the server after this long, so they can't hold a pool
+# connection forever
+IDLE_IN_TRANSACTION_SESSION_TIMEOUT = "1min"
+
+# Introspection queries, built once. Values are passed as parameters so each
+# query text stays constant and is prepared once per connection.
+_LIST_ALL_TABLES_SQL = psycopg_sql.SQL(
+    """
+    SELECT
+      n.nspname || '.' || c.relname
+    FROM
+      pg_catalog.pg_class c
+    JOIN
+      pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE
+      n.nspname = ANY (current_schemas(false)) AND
+      c.relkind IN ('r', 'p', 'f')
+    ORDER BY
+      n.nspname, c.relname;
+"""
+)
+
+_LIST_SCHEMA_TABLES_SQL = psycopg_sql.SQL(
+    """
+    SELECT
+      n.nspname || '.' || c.relname
+    FROM
+      pg_catalog.pg_class c
+    JOIN
+      pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE
+      n.nspname = %s AND
+      c.relkind IN ('r', 'p', 'f')
+    ORDER BY
+      n.nspname, c.relname;
+"""
+)
+
+_COLUMNS_SQL = psycopg_sql.SQL(
+    """
+    SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s AND c.relname = %s
+      AND c.relkind IN ('r', 'p', 'f', 'v', 'm')
+      AND a.attnum > 0 AND NOT a.attisdropped
+    ORDER BY a.attnum;
+"""
+)
+
+_MANY_COLUMNS_SQL = psycopg_sql.SQL(
+    """
+    SELECT n.nspname, c.relname, a.attname, format_type(a.atttypid, a.atttypmod)
+    FROM unnest(%s::text[], %s::text[]) AS t(schema_name, table_name)
+    JOIN pg_catalog.pg_namespace n ON n.nspname = t.schema_name
+    JOIN pg_catalog.pg_class c
+      ON c.relnamespace = n.oid AND c.relname = t.table_name
+    JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid
+    WHERE c.relkind IN ('r', 'p', 'f', 'v', 'm')
+      AND a.attnum > 0 AND NOT a.attisdropped
+    ORDER BY n.nspname, c.relname, a.attnum;
+"""
+)
+
 
 class DatabaseService:
     """Service for managing database connections and operations."""
 
-    def __init__(self, database_url: str, min_size: int = 1):
+    __slots__ = (
+        "database_url",
+        "min_size",
+        "max_size",
+        "prepare_statements",
+        "schema_cache_ttl",
+        "schema_cache_size",
+        "max_query_rows",
+        "max_query_bytes",
+        "statement_timeout",
+        "pool_timeout",
+        "pool",
+        "_schema_cache",
+        "_schema_cache_locks",
+    )
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        prepare_statements: bool = DEFAULT_PREPARE_STATEMENTS,
+        schema_cache_ttl: float = 60.0,
+        schema_cache_size: int = 256,
+        max_query_rows: int = DEFAULT_MAX_QUERY_ROWS,
+        max_query_bytes: int = DEFAULT_MAX_QUERY_BYTES,
+        statement_timeout: float = DEFAULT_STATEMENT_TIMEOUT,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT,
+    ):
         """Initialize service with database URL.
 
         Args:
             database_url: PostgreSQL connection string
-            min_size: Minimum number of connections to keep in the pool
+            min_size: Minimum number of connections to keep open in the pool
+            max_size: Maximum number of connections the pool may open
+            prepare_statements: Whether to prepare the fixed catalog lookups
+                server-side. User queries are streamed and never prepared.
+            schema_cache_ttl: Seconds to keep table lists and table schemas
+                cached; 0 disables the cache
+            schema_cache_size: Maximum number of cached introspection results;
+                0 disables the cache
+            max_query_rows: Maximum number of rows the query tool returns
+            max_query_bytes: Approximate maximum size in bytes of the rows
+                the query tool returns, measured as compact JSON
+            statement_timeout: Seconds a statement may run before the server
+                cancels it; 0 disables the limit. Steampipe queries call cloud
+                APIs and can legitimately take minutes.
+            pool_timeout: Seconds to wait for a free pool connection before
+                failing
         """
         self.database_url = database_url
         self.min_size = min_size
+        self.max_size = max_size
+        self.prepare_statements = prepare_statements
+        self.schema_cache_ttl = schema_cache_ttl
+        self.schema_cache_size = schema_cache_size
+        self.max_query_rows = max_query_rows
+        self.max_query_bytes = max_query_bytes
+        self.statement_timeout = statement_timeout
+        self.pool_timeout = pool_timeout
         self.pool: AsyncConnectionPool | None = None
+        self._schema_cache: dict[tuple[str, ...], tuple[float, Any]] = {}
+        self._schema_cache_locks: dict[tuple[str, ...], tuple[asyncio.Lock, int]] = {}
 
     async def connect(self) -> None:
         """Create and open the connection pool."""
@@ -32,11 +189,84 @@ class DatabaseService:
             return
 
         logger.info("Creating database connection pool...")
+        # NOTE: min_size connections are opened up front and kept warm, so tool
+        # calls don't pay connection setup (TCP, TLS, auth) on the critical
+        # path. Idle connections above min_size are closed after max_idle
+        # seconds, and every connection is replaced after max_lifetime seconds
+        # so server-side memory (e.g. prepared statements) doesn't grow
+        # unbounded. See https://www.psycopg.org/psycopg3/docs/advanced/pool.html
         self.pool = AsyncConnectionPool(
-            self.database_url, min_size=self.min_size, open=False
+            self.database_url,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            max_idle=300,
+            max_lifetime=3600,
+            timeout=self.pool_timeout,
+            open=False,
+            kwargs={"options": self._session_options()},
+            configure=self._configure_connection,
+            reset=self._reset_connection,
         )
         await self.pool.open(wait=True)
-        logger.info("Database pool opened.")
+        logger.info(
+            "Database pool opened with %d to %d connections.",
+            self.min_size,
+            self.max_size,
+        )
+
+    async def _configure_connection(self, conn: AsyncConnection) -> None:
+        """Configure a new pool connection before it is first used.
+
+        Args:
+            conn: Newly opened connection
+        """
+        if self.prepare_statements:
+            conn.prepare_threshold = PREPARE_THRESHOLD
+        else:
+            conn.prepare_threshold = None
+        # Catalog lookups run as single statements, so they don't need the
+        # BEGIN/COMMIT pair
+        await conn.set_autocommit(True)
+        # User queries open an explicit transaction; psycopg sends these as
+        # part of its BEGIN (BEGIN ISOLATION LEVEL READ COMMITTED READ ONLY),
+        # which a query can't undo, unlike the session defaults
+        await conn.set_isolation_level(psycopg.IsolationLevel.READ_COMMITTED)
+        await conn.set_read_only(True)
+
+    def _session_options(self) -> str:
+        """Build the startup options setting the session defaults.
+
+        Every transaction is read-only by default, and statements and abandoned
+        transactions are bounded in time. Settings passed at startup are what
+        RESET ALL returns to, so _reset_connection can undo a query changing
+        them. Options already given in the database URL are kept, ours win.
+
+        Returns:
+            Value for the libpq options connection parameter
+        """
+        options = [
+            "-c default_transaction_read_only=on",
+            "-c default_transaction_isolation=read\\ committed",
+            # Rounded up, so a short non-zero timeout isn't turned into 0 (off)
+            f"-c statement_timeout={math.ceil(self.statement_timeout * 1000)}",
+            "-c idle_in_transaction_session_timeout="
+            + IDLE_IN_TRANSACTION_SESSION_TIMEOUT,
+        ]
+        if url_options := conninfo_to_dict(self.database_url).get("options"):
+            options.insert(0, str(url_options))
+        return " ".join(options)
+
+    @staticmethod
+    async def _reset_connection(conn: AsyncConnection) -> None:
+        """Undo session changes made by a query before the connection is reused.
+
+        A read-only transaction may still run set_config() or SET, e.g. to
+        turn default_transaction_read_only off for later statements.
+
+        Args:
+            conn: Connection returned to the pool
+        """
+        await conn.execute("RESET ALL")
 
     async def close(self) -> None:
         """Close the database connection pool."""
@@ -49,6 +279,62 @@ class DatabaseService:
         self.pool = None
         logger.info("Database pool closed.")
 
+    def clear_schema_cache(self) -> None:
+        """Drop all cached table lists and table schemas."""
+        self._schema_cache.clear()
+        logger.info("Schema cache cleared.")
+
+    async def _cached(
+        self, key: tuple[str, ...], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return a cached introspection result, fetching it on a miss.
+
+        Concurrent misses for the same key are serialized so that only one
+        of them reaches the database.
+
+        Args:
+            key: Cache key, the method name followed by its arguments
+            fetch: Coroutine function producing the value on a miss
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        if self.schema_cache_ttl <= 0 or self.schema_cache_size <= 0:
+            return await fetch()
+
+        entry = self._schema_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        # Each lock is kept with the number of tasks holding or waiting on it
+        lock, users = self._schema_cache_locks.get(key, (asyncio.Lock(), 0))
+        self._schema_cache_locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                entry = self._schema_cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+
+                value = await fetch()
+                if key not in self._schema_cache and (
+                    len(self._schema_cache) >= self.schema_cache_size
+                ):
+                    # Evict the oldest entry
+                    del self._schema_cache[next(iter(self._schema_cache))]
+                self._schema_cache[key] = (
+                    time.monotonic() + self.schema_cache_ttl,
+                    value,
+                )
+                return value
+        finally:
+            # Dropped by the last user only, so tasks still waiting after a
+            # failed fetch and new callers keep sharing the same lock
+            lock, users = self._schema_cache_locks[key]
+            if users > 1:
+                self._schema_cache_locks[key] = (lock, users - 1)
+            else:
+                del self._schema_cache_locks[key]
+
     def _check_connection(self) -> AsyncConnectionPool:
         """Check if the connection pool exists."""
         if self.pool is None:
@@ -62,6 +348,9 @@ class DatabaseService:
     ) -> list[dict[str, Any]]:
         """Execute a read-only query and return results as a list of dictionaries.
 
+        Like execute_query_stream, which it collects, it accepts a single
+        statement only.
+
         Args:
             query: SQL query to execute
             params: Query parameters
@@ -69,58 +358,78 @@ class DatabaseService:
         Returns:
             List of dictionaries, one for each row
         """
+        return [row async for row in self.execute_query_stream(query, params)]
+
+    async def execute_query_stream(
+        self, query: str, params: tuple | None = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Execute a read-only query and yield rows as they are received.
+
+        The result set is never held in memory as a whole. Close the iterator
+        (e.g. with contextlib.aclosing) when stopping early, so the query is
+        cancelled and the connection is returned to the pool.
+
+        Rows are streamed with the extended query protocol, which takes a
+        single statement: input with several statements separated by ";" is
+        rejected by the server. This also keeps a query from ending the
+        read-only transaction with COMMIT and running more statements.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+
+        Yields:
+            One dictionary per row
+        """
+        self._check_read_only(query)
         pool = self._check_connection()
-        truncated = query[:100] + "..." if len(query) > 100 else query
-        logger.info(f"Executing query: {truncated}")
+        if logger.isEnabledFor(logging.INFO):
+            truncated = query[:100] + "..." if len(query) > 100 else query
+            logger.info("Streaming query: %s", truncated)
 
+        batch_size = (
+            STREAM_BATCH_SIZE if psycopg.capabilities.has_stream_chunked() else 1
+        )
+        row_count = 0
         try:
             async with pool.connection() as conn:
-                # Ensure read-only transaction
+                # Read-only through the BEGIN flags set on connect
                 async with conn.transaction():
-                    async with conn.cursor() as cur:
-                        await cur.execute(
-                            psycopg_sql.SQL(
-                                "SET TRANSACTION ISOLATION LEVEL READ COMMITTED"
-                            )
-                        )
-                        await cur.execute(psycopg_sql.SQL("SET TRANSACTION READ ONLY"))
-
-                        # Execute the query with parameters if provided
-                        if params:
-                            await cur.execute(query, params)  # type: ignore[call-arg]
-                        else:
-                            await cur.execute(query)  # type: ignore[call-arg]
-
-                        # Get column names
-                        colnames = (
-                            [desc.name for desc in cur.description]
-                            if cur.description
-                            else []
+                    async with conn.cursor(row_factory=dict_row) as cur:
+                        # Typed as an iterator, but it is a generator that
+                        # holds the connection until closed, so close it when
+                        # the caller stops early
+                        rows = cast(
+                            AsyncGenerator[dict[str, Any], None],
+                            cur.stream(query, params, size=batch_size),  # type: ignore[arg-type]
                         )
+                        async with aclosing(rows):
+                            async for row in rows:
+                                row_count += 1
+                                yield row
 
-                        # Fetch results
-                        results = await cur.fetchall()
-
-                        # Convert to list of dictionaries
-                        rows_as_dicts = [dict(zip(colnames, row)) for row in results]
-
-                        # Log the result count
-                        row_count = len(results)
-                        logger.info(f"Query executed: {row_count} rows returned.")
-                        return rows_as_dicts
-
+            logger.info("Query streamed: %d rows returned.", row_count)
         except psycopg.Error as db_err:
-            logger.error(f"Database error during query: {db_err}")
-            if hasattr(db_err, "diag"):
-                db_error_message = db_err.diag.message_primary
-            else:
-                db_error_message = str(db_err)
-            error_message = f"Database error: {db_error_message}"
-            raise ValueError(error_message) from db_err
+            raise self._query_error(db_err) from db_err
         except Exception as e:
-            logger.error(f"Unexpected error during query: {e}")
+            logger.error("Unexpected error during query: %s", e)
             raise ValueError(f"Query execution failed: {e}") from e
 
+    @staticmethod
+    def _query_error(db_err: psycopg.Error) -> ValueError:
+        """Log a database error raised by a user query and wrap it.
+
+        Args:
+            db_err: Error raised by psycopg
+
+        Returns:
+            ValueError carrying the primary error message
+        """
+        logger.error("Database error during query: %s", db_err)
+        # Client-side errors, e.g. a pool timeout, carry no server diagnostics
+        db_error_message = db_err.diag.message_primary or str(db_err)
+        return ValueError(f"Database error: {db_error_message}")
+
     async def execute_sql_query(
         self,
         sql_query: psycopg_sql.SQL | psycopg_sql.Composed,
@@ -128,6 +437,10 @@ class DatabaseService:
     ) -> list[tuple]:
         """Execute a parameterized SQL query using psycopg_sql composable objects.
 
+        The query runs in autocommit mode, without a BEGIN/COMMIT pair; it is
+        still read-only through the session defaults. Only use it for the
+        fixed catalog queries, user queries go through execute_query.
+
         Args:
             sql_query: SQL query to execute as psycopg_sql.SQL object
             params: Additional parameters (beyond those in SQL Composable)
@@ -145,126 +458,178 @@ class DatabaseService:
                         await cur.execute(sql_query)
                     return await cur.fetchall()
         except psycopg.Error as db_err:
-            logger.error(f"Database error: {db_err}")
+            logger.error("Database error: %s", db_err)
             raise ValueError(f"Database error: {db_err}") from db_err
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             raise ValueError(f"Query execution failed: {e}") from e
 
     async def list_all_tables(self) -> list[str]:
         """List all tables in all schemas in the search path.
 
+        Results are cached for ``schema_cache_ttl`` seconds.
+
         Returns:
             List of tables in format schema.table
         """
-        sql = psycopg_sql.SQL(
-            """
-            WITH search_path_schemas AS (
-              SELECT unnest(string_to_array(current_setting(
-                'search_path'), ', ')) AS schema_name
-            )
-            SELECT
-              CONCAT(t.table_schema, '.', t.table_name)
-            FROM
-              information_schema.tables t
-            JOIN
-              search_path_schemas s ON t.table_schema = s.schema_name
-            WHERE
-              t.table_type IN ('BASE TABLE', 'FOREIGN')
-            ORDER BY
-              t.table_schema;
-        """
-        )
+        return await self._cached(("list_all_tables",), self._fetch_all_tables)
 
+    async def _fetch_all_tables(self) -> list[str]:
+        """Query the database for all tables in the search path."""
         try:
-            results = await self.execute_sql_query(sql)
+            results = await self.execute_sql_query(_LIST_ALL_TABLES_SQL)
             tables = [row[0] for row in results]
-            logger.info(f"Found {len(tables)} tables.")
+            logger.info("Found %d tables.", len(tables))
             return tables
         except Exception as e:
-            logger.error(f"Error listing tables: {e}")
+            logger.error("Error listing tables: %s", e)
             raise ValueError(f"Failed to list tables: {e}") from e
 
     async def list_tables_in_schema(self, schema_name: str) -> list[str]:
         """List all tables in a specific schema.
 
+        Results are cached for ``schema_cache_ttl`` seconds.
+
         Args:
             schema_name: Schema name to query
 
         Returns:
             List of tables in format schema.table
         """
-        sql = psycopg_sql.SQL(
-            """
-            SELECT
-              CONCAT(t.table_schema, '.', t.table_name)
-            FROM
-              information_schema.tables t
-            WHERE
-              t.table_schema = %s AND
-              t.table_type IN ('BASE TABLE', 'FOREIGN')
-            ORDER BY
-              t.table_schema;
-        """
+        return await self._cached(
+            ("list_tables_in_schema", schema_name),
+            lambda: self._fetch_tables_in_schema(schema_name),
         )
 
+    async def _fetch_tables_in_schema(self, schema_name: str) -> list[str]:
+        """Query the database for all tables in a specific schema."""
         try:
-            results = await self.execute_sql_query(sql, (schema_name,))
+            results = await self.execute_sql_query(
+                _LIST_SCHEMA_TABLES_SQL, (schema_name,)
+            )
             tables = [row[0] for row in results]
-            logger.info(f"Found {len(tables)} tables in schema {schema_name}.")
+            logger.info("Found %d tables in schema %s.", len(tables), schema_name)
             return tables
         except Exception as e:
-            logger.error(f"Error listing tables in schema {schema_name}: {e}")
+            logger.error("Error listing tables in schema %s: %s", schema_name, e)
             raise ValueError(f"Failed to list tables: {e}") from e
 
     async def get_table_schema(self, table_name: str) -> str:
         """Get schema information for a table.
 
+        Results are cached for ``schema_cache_ttl`` seconds.
+
         Args:
             table_name: Table name in format schema.table
 
         Returns:
             JSON string with column information
         """
-        logger.info(f"Fetching schema for table: {table_name}")
+        return await self._cached(
+            ("get_table_schema", table_name),
+            lambda: self._fetch_table_schema(table_name),
+        )
 
-        # Parse schema and table
-        try:
-            parts = table_name.split(".", 1)  # Split only once
-            if len(parts) != 2:
-                raise ValueError(
-                    f"Invalid table name format: '{table_name}'."
-                    " Expected 'schema.table'."
-                )
-            schema, table = parts[0], parts[1]
-            logger.debug(f"Parsed schema='{schema}', table='{table}'")
-        except Exception as e:
-            logger.error(f"Error parsing table name '{table_name}': {e}")
-            raise ValueError(f"Invalid table name format provided: {table_name}") from e
-
-        # Query for column information
-        query = psycopg_sql.SQL(
-            """
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_name = {} AND table_schema = {}
-            ORDER BY ordinal_position;
-        """
-        ).format(psycopg_sql.Literal(table), psycopg_sql.Literal(schema))
+    async def _fetch_table_schema(self, table_name: str) -> str:
+        """Query the database for the columns of a table."""
+        logger.info("Fetching schema for table: %s", table_name)
+        schema, table = self._parse_table_name(table_name)
 
         try:
-            columns = await self.execute_sql_query(query)
+            columns = await self.execute_sql_query(_COLUMNS_SQL, (schema, table))
             if not columns:
-                logger.warning(f"Table '{table_name}' not found or has no columns.")
+                logger.warning("Table '%s' not found or has no columns.", table_name)
                 raise ValueError(f"Table '{table_name}' not found or is empty.")
 
             schema_info = [
                 {"column_name": col[0], "data_type": col[1]} for col in columns
             ]
-            logger.info(f"Schema fetched for {table_name} with {len(columns)} columns.")
-            return json.dumps(schema_info, indent=2)
+            logger.info(
+                "Schema fetched for %s with %d columns.", table_name, len(columns)
+            )
+            return orjson.dumps(schema_info, option=orjson.OPT_INDENT_2).decode()
         except Exception as e:
             if isinstance(e, ValueError):
                 raise
-            logger.error(f"Error fetching schema for {table_name}: {e}")
+            logger.error("Error fetching schema for %s: %s", table_name, e)
             raise ValueError(f"Failed to get schema: {e}") from e
+
+    async def get_many_table_schemas(
+        self, table_names: list[str]
+    ) -> dict[str, list[dict[str, str]]]:
+        """Get schema information for several tables with a single query.
+
+        Results are cached for ``schema_cache_ttl`` seconds.
+
+        Args:
+            table_names: Table names in format schema.table
+
+        Returns:
+            Dictionary mapping each table name to its column information
+        """
+        table_names = list(dict.fromkeys(table_names))  # Drop duplicates
+        return await self._cached(
+            ("get_many_table_schemas", *table_names),
+            lambda: self._fetch_many_table_schemas(table_names),
+        )
+
+    async def _fetch_many_table_schemas(
+        self, table_names: list[str]
+    ) -> dict[str, list[dict[str, str]]]:
+        """Query the database for the columns of several tables."""
+        logger.info("Fetching schemas for %d tables.", len(table_names))
+        parsed = [self._parse_table_name(name) for name in table_names]
+        schemas = [schema for schema, _ in parsed]
+        tables = [table for _, table in parsed]
+
+        try:
+            rows = await self.execute_sql_query(_MANY_COLUMNS_SQL, (schemas, tables))
+        except Exception as e:
+            logger.error("Error fetching schemas for %s: %s", table_names, e)
+            raise ValueError(f"Failed to get schemas: {e}") from e
+
+        schema_info: dict[str, list[dict[str, str]]] = {
+            name: [] for name in table_names
+        }
+        for schema, table, column_name, data_type in rows:
+            schema_info[f"{schema}.{table}"].append(
+                {"column_name": column_name, "data_type": data_type}
+            )
+
+        missing = [name for name, columns in schema_info.items() if not columns]
+        if missing:
+            logger.warning("Tables not found or have no columns: %s", missing)
+            raise ValueError(f"Tables not found or empty: {', '.join(missing)}")
+
+        logger.info("Schemas fetched for %d tables.", len(schema_info))
+        return schema_info
+
+    @staticmethod
+    def _parse_table_name(table_name: str) -> tuple[str, str]:
+        """Split a table name in format schema.table into its parts.
+
+        Args:
+            table_name: Table name in format schema.table
+
+        Returns:
+            Tuple of schema and table name
+        """
+        if not (match := _TABLE_NAME_RE.match(table_name)):
+            logger.error(
+                "Error parsing table name '%s': expected 'schema.table'.", table_name
+            )
+            raise ValueError(f"Invalid table name format provided: {table_name}")
+        schema, table = match.groups()
+        logger.debug("Parsed schema='%s', table='%s'", schema, table)
+        return schema, table
+
+    @staticmethod
+    def _check_read_only(query: str) -> None:
+        """Reject a query that does not start with a read-only command.
+
+        Args:
+            query: SQL query to check
+        """
+        if not _READ_ONLY_PREFIX.match(query):
+            logger.error("Rejected query not starting with a read-only command.")
+            raise ValueError("Only read-only statements are allowed")
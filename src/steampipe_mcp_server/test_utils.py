@@ -4,8 +4,6 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
-from psycopg_pool import AsyncConnectionPool
-
 from .database import DatabaseService
 from .server import settings
 
@@ -31,63 +29,38 @@ async def create_test_db_service(
         await db_service.close()
 
 
-# Keep the old pool-based function for backward compatibility
-@asynccontextmanager
-async def create_test_pool(
-    test_db_url: str,
-) -> AsyncGenerator[AsyncConnectionPool, None]:
-    """Create a test database connection pool for testing (deprecated).
-
-    Args:
-        test_db_url: The database URL to connect to
-
-    Yields:
-        An AsyncConnectionPool connected to the test database
-    """
-    settings.database_url = test_db_url
-    pool = AsyncConnectionPool(test_db_url, min_size=1, open=False)
-    try:
-        await pool.open(wait=True)
-        yield pool  # type: ignore
-    finally:
-        await pool.close()
-
-
 class MockContext:
     """Mock MCP context for testing."""
 
-    def __init__(self, db_service_or_pool: DatabaseService | AsyncConnectionPool):
-        """Initialize with a database service or pool.
+    __slots__ = ("request_context",)
+
+    def __init__(self, db_service: DatabaseService):
+        """Initialize with a database service.
 
         Args:
-            db_service_or_pool: The DatabaseService or AsyncConnectionPool to use
+            db_service: The DatabaseService to use
         """
 
         class MockRequestContext:
+            __slots__ = ("lifespan_context",)
+
             def __init__(self, lifespan_context: dict[str, Any]):
                 self.lifespan_context = lifespan_context
 
-        # Handle either a DatabaseService or a connection pool
-        if isinstance(db_service_or_pool, DatabaseService):
-            self.request_context = MockRequestContext(
-                {"db_service": db_service_or_pool}
-            )
-        else:
-            # Backward compatibility for old tests
-            self.request_context = MockRequestContext({"pool": db_service_or_pool})
+        self.request_context = MockRequestContext({"db_service": db_service})
 
 
 @asynccontextmanager
 async def mock_mcp_context(
-    db_service_or_pool: DatabaseService | AsyncConnectionPool,
+    db_service: DatabaseService,
 ) -> AsyncGenerator[MockContext, None]:
     """Create a mock MCP context with a database service for testing tools.
 
     Args:
-        db_service_or_pool: The DatabaseService or connection pool to use
+        db_service: The DatabaseService to use
 
     Yields:
         A mock context that can be used with tool functions
     """
-    mock_ctx = MockContext(db_service_or_pool)
+    mock_ctx = MockContext(db_service)
     yield mock_ctx
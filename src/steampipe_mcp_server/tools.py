@@ -1,5 +1,9 @@
 """MCP tools for interacting with PostgreSQL databases."""
 
+from contextlib import aclosing
+from typing import Annotated
+
+import orjson
 from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.utilities.logging import get_logger
 from pydantic import Field
@@ -45,20 +49,83 @@ async def get_table_schema(
     return await db_service.get_table_schema(table_name)
 
 
+@mcp.tool(name="get_table_schemas")
+async def get_table_schemas(
+    ctx: Context,
+    table_names: list[str] = Field(
+        ..., description="Names of the tables with schema, i.e. public.my_table"
+    ),
+) -> str:
+    """
+    Gets the column names and data types for several tables in one call.
+    Expects each table name in the format 'schema.table'. Prefer this over
+    calling get_table_schema repeatedly.
+    """
+    db_service: DatabaseService = ctx.request_context.lifespan_context["db_service"]
+    schema_info = await db_service.get_many_table_schemas(table_names)
+    return orjson.dumps(schema_info, option=orjson.OPT_INDENT_2).decode()
+
+
+@mcp.tool(name="refresh_metadata")
+async def refresh_metadata(ctx: Context) -> str:
+    """
+    Clears the cached table lists and table schemas, so the next lookups
+    read them from the database again. Use after tables or connections
+    have been added or changed.
+    """
+    db_service: DatabaseService = ctx.request_context.lifespan_context["db_service"]
+    db_service.clear_schema_cache()
+    return "Metadata cache cleared."
+
+
 @mcp.tool()
 async def query(
     ctx: Context,
     sql: str = Field(..., description="Read-only SQL query to execute"),
+    max_rows: Annotated[
+        int | None,
+        Field(
+            description="Maximum number of rows to return, up to the server limit",
+            ge=1,
+        ),
+    ] = None,
 ) -> str:
     """
     Runs a read-only SQL query against the database and returns results as JSON.
-    Only SELECT statements are effectively processed due to read-only transaction.
+    Queries must be a single statement starting with SELECT, WITH, EXPLAIN,
+    SHOW, VALUES or TABLE, and run in a read-only transaction.
+    Large results are cut off at max_rows or the server's row and size limits;
+    a final {"__truncated__": true, "reason": ...} entry marks a cut-off result.
     """
     db_service: DatabaseService = ctx.request_context.lifespan_context["db_service"]
-    results = await db_service.execute_query(sql)
+    row_limit = db_service.max_query_rows
+    if max_rows is not None:
+        row_limit = min(max_rows, row_limit)
 
-    # The execute_query method returns a list of dictionaries
-    # Convert to JSON string with appropriate formatting
-    import json
+    # Encode rows as they arrive instead of collecting them first; values
+    # orjson can't serialize natively (e.g. Decimal) fall back to str()
+    buf = bytearray(b"[")
+    row_count = 0
+    reason = None
+    async with aclosing(db_service.execute_query_stream(sql)) as rows:
+        async for row in rows:
+            if row_count >= row_limit:
+                reason = "row_cap"
+                break
+            encoded = orjson.dumps(row, default=str)
+            # One more byte for the following "," or "]"
+            if len(buf) + len(encoded) + 1 > db_service.max_query_bytes:
+                reason = "byte_cap"
+                break
+            if row_count:
+                buf += b","
+            buf += encoded
+            row_count += 1
 
-    return json.dumps(results, indent=2, default=str)
+    if reason is not None:
+        logger.warning("Query result truncated at %d rows (%s).", row_count, reason)
+        if row_count:
+            buf += b","
+        buf += orjson.dumps({"__truncated__": True, "reason": reason})
+    buf += b"]"
+    return buf.decode()